@@ -2,11 +2,27 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
+from pathlib import Path
 
-from dotenv import load_dotenv
 
-# laad .env automatisch als aanwezig
-load_dotenv()
+def _find_env_file() -> Path | None:
+    """Zoek .env zoals find_dotenv: vanaf core/ omhoog door de bovenliggende mappen."""
+    for directory in Path(__file__).resolve().parents:
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+# laad .env alleen als die er is (lokale ontwikkeling); in containers staan de
+# variabelen al in os.environ en slaan we dotenv volledig over.
+# ZORGWAARD_SKIP_DOTENV=1 slaat ook het zoeken naar .env over.
+if os.getenv("ZORGWAARD_SKIP_DOTENV") != "1":
+    _env_file = _find_env_file()
+    if _env_file is not None:
+        from dotenv import load_dotenv
+
+        load_dotenv(_env_file)
 
 
 class Settings:
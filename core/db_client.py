@@ -3,8 +3,10 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from functools import lru_cache
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import declarative_base, scoped_session, sessionmaker
 
@@ -19,23 +21,41 @@ Base = declarative_base()
 # -------------------------------------------------------
 # Engine & Session configuratie
 # -------------------------------------------------------
-settings = get_settings()
+# Lazy: modellen importeren alleen Base, dus zonder databasewerk geen engine,
+# geen settings-parse en geen connectiepool bij import.
 
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,       # check verbindingen voordat ze gebruikt worden
-    pool_size=5,              # max aantal actieve connecties
-    max_overflow=10,          # extra connecties als pool vol zit
-    future=True,              # moderne SQLAlchemy API
-)
+# Seconden per verbindingspoging; zonder timeout blijft een probe naar een
+# onbereikbare host hangen op de TCP-timeout van het OS in plaats van de
+# backoff in _wait_for_database te volgen.
+CONNECT_TIMEOUT = 5
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Geef de gedeelde SQLAlchemy-engine; wordt bij het eerste gebruik aangemaakt."""
+    return create_engine(
+        get_settings().database_url,
+        pool_pre_ping=True,       # check verbindingen voordat ze gebruikt worden
+        pool_size=5,              # max aantal actieve connecties
+        max_overflow=10,          # extra connecties als pool vol zit
+        future=True,              # moderne SQLAlchemy API
+        connect_args={"connect_timeout": CONNECT_TIMEOUT},  # libpq, psycopg en psycopg2
+    )
+
+
+@lru_cache(maxsize=1)
+def _session_factory() -> scoped_session:
+    return scoped_session(
+        sessionmaker(bind=get_engine(), autocommit=False, autoflush=False, future=True)
+    )
 
-SessionLocal = scoped_session(
-    sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
-)
 
 _db_ready = False
 _db_ready_lock = threading.Lock()
 
+# Eenmalig opgebouwd zodat elke probe dezelfde gecompileerde statement hergebruikt
+_PROBE = text("SELECT 1")
+
 
 # -------------------------------------------------------
 # Helpers
@@ -54,15 +74,17 @@ def _wait_for_database(max_attempts: int = 6, initial_delay: float = 1.0) -> Non
         if _db_ready:
             return
 
+        engine = get_engine()
         delay = initial_delay
         for attempt in range(1, max_attempts + 1):
             try:
                 with engine.connect() as connection:
-                    connection.execute(text("SELECT 1"))
+                    connection.execute(_PROBE)
                 _db_ready = True
                 return
             except OperationalError as exc:  # database still warming up
-                engine.dispose()  # drop broken connections from the pool
+                # Geen engine.dispose(): een mislukte connect komt nooit in de pool,
+                # en pool_pre_ping vangt verbindingen op die later wegvallen.
                 if attempt == max_attempts:
                     logger.error(
                         "Database did not become ready after %s attempts", attempt
@@ -81,10 +103,10 @@ def _wait_for_database(max_attempts: int = 6, initial_delay: float = 1.0) -> Non
 def get_session():
     """Return a new SQLAlchemy Session (scoped)."""
     _wait_for_database()
-    return SessionLocal()
+    return _session_factory()()
 
 
 def init_db():
     _wait_for_database()
-    run_pending_migrations(engine)
+    run_pending_migrations(get_engine())
     logger.info("Database migrations executed.")
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import threading
+
 from openai import OpenAI
 
 from core.config import get_settings
 
 _client: OpenAI | None = None
+_client_lock = threading.Lock()
 
 def get_openai_client() -> OpenAI:
     """
     Geef een singleton OpenAI-client die de API key uit settings gebruikt.
+    Streamlit bedient sessies vanuit een threadpool; de lock voorkomt dat
+    gelijktijdige reruns elk een eigen client (en connectiepool) opbouwen.
     """
     global _client
-    if _client is None:
-        settings = get_settings()
-        _client = OpenAI(api_key=settings.openai_api_key)
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            settings = get_settings()
+            _client = OpenAI(api_key=settings.openai_api_key)
     return _client
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import streamlit as st
 
 from core.config import get_settings
@@ -15,26 +16,36 @@ settings = get_settings()
 # ----------------------------------------------------------------------
 # Embeddings
 # ----------------------------------------------------------------------
-def embed_text(text: str) -> Optional[List[float]]:
-    """Maak een embedding vector van tekst. Retourneert None bij lege input of fout."""
+def embed_text(text: str) -> Optional[np.ndarray]:
+    """
+    Maak een embedding vector (float32 ndarray) van tekst.
+    Retourneert None bij lege input of fout; test dus op `is None`, niet op truthiness.
+    """
     text = (text or "").strip()
     if not text:
         return None
-    return _cached_embed(settings.embed_model, text)
-
-
-@st.cache_data(show_spinner=False)
-def _cached_embed(model: str, text: str) -> Optional[List[float]]:
     try:
-        client = get_openai_client()
-        response = client.embeddings.create(input=text, model=model)
-        return response.data[0].embedding
+        return _cached_embed(settings.embed_model, text)
     except Exception as exc:  # pragma: no cover
         logger.exception("Embedding fout", exc_info=exc)
         st.error(f"Embedding fout: {exc}")
         return None
 
 
+# Embeddings zijn deterministisch per (model, tekst); herhaalde vragen en conceptteksten
+# gaan zo niet opnieuw naar OpenAI. Bewust alleen in het geheugen: op schijf zou elke
+# vraag en notitietekst onversleuteld blijven staan, en Streamlit ruimt die bestanden
+# niet op via max_entries of ttl. Opgeslagen notities hebben hun embedding al in de
+# database. Fouten worden niet gecachet omdat de exceptie de cache-entry voorkomt.
+@st.cache_data(max_entries=256, show_spinner=False)
+def _cached_embed(model: str, text: str) -> np.ndarray:
+    client = get_openai_client()
+    response = client.embeddings.create(input=text, model=model)
+    # float32 is wat pgvector opslaat; een aaneengesloten array is ~7x kleiner
+    # dan een lijst Python-floats en gaat zonder omweg naar de database.
+    return np.asarray(response.data[0].embedding, dtype=np.float32)
+
+
 # ----------------------------------------------------------------------
 # Chat (vrije tekst)
 # ----------------------------------------------------------------------
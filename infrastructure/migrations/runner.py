@@ -19,11 +19,32 @@ def _iter_statements(sql: str) -> Iterable[str]:
             yield stripped
 
 
+def _applied_migrations(conn) -> set[str]:
+    return {
+        row[0] for row in conn.execute(text("SELECT filename FROM schema_migrations"))
+    }
+
+
+def _pending_migrations(engine: Engine) -> list[Path]:
+    """Read-only check: which migration files are not recorded yet."""
+    paths = sorted(MIGRATIONS_DIR.glob("*.sql"))
+    with engine.connect() as conn:
+        has_table = conn.execute(
+            text("SELECT to_regclass('schema_migrations')")
+        ).scalar()
+        applied = _applied_migrations(conn) if has_table else set()
+    return [path for path in paths if path.name not in applied]
+
+
 def run_pending_migrations(engine: Engine) -> None:
     """Apply any migrations that have not been recorded yet."""
     if not MIGRATIONS_DIR.exists():
         return
 
+    # An up-to-date database costs one read-only query: no DDL, no locks.
+    if not _pending_migrations(engine):
+        return
+
     with engine.begin() as conn:
         conn.exec_driver_sql(
             """
@@ -34,10 +55,7 @@ def run_pending_migrations(engine: Engine) -> None:
             """
         )
 
-        applied = {
-            row[0]
-            for row in conn.execute(text("SELECT filename FROM schema_migrations"))
-        }
+        applied = _applied_migrations(conn)
 
         for path in sorted(MIGRATIONS_DIR.glob("*.sql")):
             name = path.name
@@ -0,0 +1,14 @@
+-- ======================
+-- ENTITY LOOKUP
+-- ======================
+-- _ensure_entities zoekt op (entity_type, canonical_value) als paar; met een
+-- samengestelde index wordt dat één index-probe per sleutel in plaats van een
+-- bitmap-combinatie van de losse indexen.
+CREATE INDEX IF NOT EXISTS entities_type_canonical_idx
+    ON entities(entity_type, canonical_value);
+
+-- ======================
+-- TAGS
+-- ======================
+-- tags.name heeft al een UNIQUE-index; de extra index is overbodig schrijfwerk.
+DROP INDEX IF EXISTS tags_name_idx;
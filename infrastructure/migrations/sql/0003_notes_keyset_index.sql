@@ -0,0 +1,7 @@
+-- ======================
+-- NOTES KEYSET
+-- ======================
+-- list_notes pagineert op (created_at, id); deze index dekt zowel de sortering
+-- als de rij-vergelijking en vervangt de index op alleen created_at.
+CREATE INDEX IF NOT EXISTS notes_created_at_id_idx ON notes(created_at DESC, id DESC);
+DROP INDEX IF EXISTS notes_created_at_idx;
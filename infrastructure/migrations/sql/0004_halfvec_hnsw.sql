@@ -0,0 +1,30 @@
+-- ======================
+-- EMBEDDINGS: HALFVEC + HNSW
+-- ======================
+-- Vanaf pgvector 0.7 bestaat halfvec (fp16), waarvoor HNSW tot 4000 dimensies
+-- indexeert. Daarmee past een index op de 3072-dim embeddings en halveert de
+-- opslag. Op oudere servers blijft de kolom vector(3072) zonder index.
+-- Queries hoeven niet te veranderen: de vector-parameter wordt als ongetypeerde
+-- literal meegestuurd en door Postgres naar het kolomtype omgezet.
+DO $$
+DECLARE
+    ext_version int[];
+BEGIN
+    SELECT string_to_array(split_part(extversion, '-', 1), '.')::int[]
+      INTO ext_version
+      FROM pg_extension
+     WHERE extname = 'vector';
+
+    IF ext_version IS NOT NULL AND ext_version >= ARRAY[0, 7] THEN
+        ALTER TABLE embeddings
+            ALTER COLUMN embedding TYPE halfvec(3072)
+            USING embedding::halfvec(3072);
+
+        CREATE INDEX IF NOT EXISTS embeddings_hnsw_cosine_idx
+            ON embeddings USING hnsw (embedding halfvec_cosine_ops)
+            WITH (m = 16, ef_construction = 64);
+    ELSE
+        RAISE NOTICE 'pgvector zonder halfvec; embeddings blijven zonder ANN-index';
+    END IF;
+END
+$$;
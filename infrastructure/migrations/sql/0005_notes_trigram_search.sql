@@ -0,0 +1,11 @@
+-- ======================
+-- NOTES ZOEKEN
+-- ======================
+-- list_notes(search=...) filtert met een ILIKE-substring op titel, samenvatting en
+-- auteur. Trigram-GIN-indexen maken dat een index-scan in plaats van een
+-- sequentiële scan over alle notities.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS notes_title_trgm_idx ON notes USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS notes_summary_trgm_idx ON notes USING gin (summary gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS notes_author_trgm_idx ON notes USING gin (author gin_trgm_ops);
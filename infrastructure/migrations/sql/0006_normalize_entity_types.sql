@@ -0,0 +1,37 @@
+-- ======================
+-- ENTITIES: GENORMALISEERD TYPE
+-- ======================
+-- Nieuwe entiteiten krijgen een getrimd, lowercase entity_type en altijd een
+-- canonical_value (zie _entity_key). Bestaande rijen worden hier gelijkgetrokken,
+-- zodat bv. ('App', 'Knox') en ('app', 'Knox') niet naast elkaar blijven bestaan
+-- en filters de kolommen direct kunnen vergelijken.
+UPDATE entities
+   SET entity_type = coalesce(nullif(lower(trim(entity_type)), ''), 'onbekend'),
+       canonical_value = coalesce(canonical_value, value)
+ WHERE entity_type IS DISTINCT FROM
+           coalesce(nullif(lower(trim(entity_type)), ''), 'onbekend')
+    OR canonical_value IS NULL;
+
+-- Dubbelen per (entity_type, canonical_value): de oudste rij blijft bestaan.
+CREATE TEMP TABLE entity_merge ON COMMIT DROP AS
+SELECT id, keep_id
+  FROM (
+        SELECT id,
+               first_value(id) OVER (
+                   PARTITION BY entity_type, canonical_value
+                   ORDER BY created_at NULLS LAST, id
+               ) AS keep_id
+          FROM entities
+       ) ranked
+ WHERE id <> keep_id;
+
+-- Koppelingen naar de dubbele rijen verhuizen naar de behouden entiteit; was de
+-- notitie daar al aan gekoppeld, dan vervalt de dubbele koppeling.
+INSERT INTO note_entities (note_id, entity_id, role, created_at, updated_at)
+SELECT ne.note_id, m.keep_id, ne.role, ne.created_at, ne.updated_at
+  FROM note_entities ne
+  JOIN entity_merge m ON m.id = ne.entity_id
+ON CONFLICT (note_id, entity_id) DO NOTHING;
+
+-- ON DELETE CASCADE ruimt de oude koppelingen op.
+DELETE FROM entities WHERE id IN (SELECT id FROM entity_merge);
@@ -0,0 +1,36 @@
+-- ======================
+-- ENTITIES: GETRIMDE WAARDE, HOOFDLETTERONGEVOELIG ZOEKEN
+-- ======================
+-- _entity_key trimt canonical_value bij het schrijven; oudere rijen kunnen nog
+-- spaties bevatten. Een lege waarde valt terug op de getrimde ruwe waarde.
+UPDATE entities
+   SET canonical_value = coalesce(nullif(trim(canonical_value), ''), trim(value))
+ WHERE canonical_value IS DISTINCT FROM
+           coalesce(nullif(trim(canonical_value), ''), trim(value));
+
+-- Trimmen kan nieuwe dubbelen opleveren; samenvoegen zoals in 0006. De tijdelijke
+-- tabel heeft een eigen naam omdat alle migraties in één transactie draaien.
+CREATE TEMP TABLE entity_value_merge ON COMMIT DROP AS
+SELECT id, keep_id
+  FROM (
+        SELECT id,
+               first_value(id) OVER (
+                   PARTITION BY entity_type, canonical_value
+                   ORDER BY created_at NULLS LAST, id
+               ) AS keep_id
+          FROM entities
+       ) ranked
+ WHERE id <> keep_id;
+
+INSERT INTO note_entities (note_id, entity_id, role, created_at, updated_at)
+SELECT ne.note_id, m.keep_id, ne.role, ne.created_at, ne.updated_at
+  FROM note_entities ne
+  JOIN entity_value_merge m ON m.id = ne.entity_id
+ON CONFLICT (note_id, entity_id) DO NOTHING;
+
+DELETE FROM entities WHERE id IN (SELECT id FROM entity_value_merge);
+
+-- De entiteitfilters in search_notes_by_similarity vergelijken
+-- lower(canonical_value); de schrijfwijze blijft bewaard voor weergave.
+CREATE INDEX IF NOT EXISTS entities_type_lower_canonical_idx
+    ON entities (entity_type, lower(canonical_value));
@@ -20,7 +20,9 @@ class Embedding(Base):
     )
     model = Column(String, nullable=False)
     dim = Column(String, nullable=False)
-    embedding = Column(Vector(3072), nullable=False)  # text-embedding-3-large
+    # text-embedding-3-large; op pgvector 0.7+ is de kolom halfvec(3072) (migratie 0004),
+    # met hetzelfde tekstformaat, dus Vector blijft als Python-type bruikbaar.
+    embedding = Column(Vector(3072), nullable=False)
     created_at = Column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
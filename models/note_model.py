@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Optional
 
 from sqlalchemy import CheckConstraint, Column, DateTime, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
@@ -11,6 +12,9 @@ from sqlalchemy.orm import relationship
 from core.db_client import Base
 
 
+NOTE_STATUSES = ("draft", "published", "archived")
+
+
 class Note(Base):
     __tablename__ = "notes"
 
@@ -66,3 +70,30 @@ class Note(Base):
 class NoteSearchResult:
     note: "Note"
     score: float
+
+
+@dataclass(frozen=True)
+class NoteListItem:
+    """Lichte weergave van een notitie voor lijsten, zonder inhoud of relaties."""
+
+    id: uuid.UUID
+    title: str
+    summary: str
+    author: str
+    status: str
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class NoteSnapshot:
+    """Onveranderlijke kopie van een notitie voor weergave, zonder relaties."""
+
+    id: uuid.UUID
+    title: str
+    content: str
+    summary: str
+    author: str
+    status: str
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
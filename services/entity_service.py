@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from typing import List
 
+from sqlalchemy.orm import load_only
+
 from core.db_client import get_session
 from models.entity_model import Entity
 
@@ -11,8 +13,12 @@ def list_entities(limit: int = 100) -> List[Entity]:
     db = get_session()
 
     try:
+        # Alleen de kolommen die de filters gebruiken; tijdstempels blijven in de DB.
         entities = (
             db.query(Entity)
+            .options(
+                load_only(Entity.entity_type, Entity.value, Entity.canonical_value)
+            )
             .order_by(Entity.created_at.desc())
             .limit(limit)
             .all()
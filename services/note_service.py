@@ -2,15 +2,26 @@ from __future__ import annotations
 
 import uuid
 from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
-from sqlalchemy.orm import joinedload
+import numpy as np
+from sqlalchemy import and_, func, insert, or_, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
 
-from core.db_client import get_session
+from core.db_client import get_engine, get_session
 from infrastructure.llm.llm_utils import embed_text
 from models.embedding_model import Embedding
 from models.entity_model import Entity, NoteEntity
-from models.note_model import Note, NoteSearchResult
+from models.note_model import (
+    NOTE_STATUSES,
+    Note,
+    NoteListItem,
+    NoteSearchResult,
+    NoteSnapshot,
+)
 from models.tag_model import NoteTag, Tag
 from services.relation_service import list_relations_for_notes
 
@@ -39,7 +50,7 @@ def create_note(
     summary: str,
     author: str,
     status: str = "draft",
-    embedding: Optional[List[float]] = None,
+    embedding: Optional[np.ndarray] = None,
     entities: Optional[List[dict]] = None,
     tags: Optional[List[str]] = None,
     embed_model: str = "text-embedding-3-large",
@@ -47,6 +58,12 @@ def create_note(
     """
     Maak een nieuwe Note met optioneel embedding, entities en tags.
     """
+    # Status wordt bij het schrijven genormaliseerd, zodat filters de kolom
+    # direct kunnen vergelijken zonder lower() per rij.
+    status = (status or "").strip().lower()
+    if status not in NOTE_STATUSES:
+        raise ValueError(f"Ongeldige status: {status or '(leeg)'}")
+
     with get_session() as db:
 
         note = Note(
@@ -61,7 +78,7 @@ def create_note(
         db.flush()  # nodig om note.id beschikbaar te maken
 
          # Embedding
-        if embedding:
+        if embedding is not None and len(embedding):
             emb = Embedding(
                 note_id=note.id,
                 model=embed_model,
@@ -72,60 +89,166 @@ def create_note(
 
         # Entities
         if entities:
-            for ent in entities:
-                canonical = ent.get("canonical_value") or ent.get("value")
-                entity = (
-                    db.query(Entity)
-                    .filter(
-                        Entity.canonical_value == canonical,
-                        Entity.entity_type == ent.get("entity_type"),
-                    )
-                    .first()
-                )
-                if not entity:
-                    entity = Entity(
-                        id=uuid.uuid4(),
-                        entity_type=ent.get("entity_type", "onbekend"),
-                        value=ent.get("value"),
-                        canonical_value=canonical,
-                    )
-                    db.add(entity)
-                    db.flush()
-                link = NoteEntity(
-                    note_id=note.id,
-                    entity_id=entity.id,
-                    role=ent.get("role"),
-                )
-                db.add(link)
+            entity_links = [
+                {"note_id": note.id, "entity_id": entity_id, "role": role}
+                for entity_id, role in _ensure_entities(db, entities)
+            ]
+            if entity_links:
+                db.execute(insert(NoteEntity), entity_links)
 
         # Tags
         if tags:
-            for tag_name in tags:
-                tag = db.query(Tag).filter(Tag.name == tag_name).first()
-                if not tag:
-                    tag = Tag(id=uuid.uuid4(), name=tag_name)
-                    db.add(tag)
-                    db.flush()
-                link = NoteTag(note_id=note.id, tag_id=tag.id)
-                db.add(link)
+            tag_ids = _ensure_tags(db, tags)
+            if tag_ids:
+                db.execute(
+                    insert(NoteTag),
+                    [{"note_id": note.id, "tag_id": tag_id} for tag_id in tag_ids],
+                )
 
         db.commit()
         db.refresh(note)
         return note
 
-def list_notes(limit: int = 50) -> List[Note]:
+
+def _entity_key(ent: dict) -> Tuple[str, str]:
+    # Type en waarde getrimd, zodat "Wijkteam " en "Wijkteam" één entiteit zijn.
+    return (
+        (ent.get("entity_type") or "").strip().lower() or "onbekend",
+        (ent.get("canonical_value") or "").strip() or (ent.get("value") or "").strip(),
+    )
+
+
+def _unique_entities(entities: List[dict]) -> List[dict]:
+    """Ontdubbel entiteiten op (type, canonieke waarde); de eerste wint."""
+    unique: dict[tuple, dict] = {}
+    for ent in entities:
+        unique.setdefault(_entity_key(ent), ent)
+    return list(unique.values())
+
+
+def _ensure_entities(db, entities: List[dict]) -> List[Tuple[uuid.UUID, Optional[str]]]:
+    """
+    Zoek of maak alle entiteiten met één SELECT en één multi-row INSERT.
+    Retourneert (entity_id, role) per unieke entiteit.
+    """
+    wanted = [ent for ent in _unique_entities(entities) if _entity_key(ent)[1]]
+    if not wanted:
+        return []
+
+    keys = [_entity_key(ent) for ent in wanted]
+    existing = {
+        (row.entity_type, row.canonical_value): row.id
+        for row in db.query(Entity.id, Entity.entity_type, Entity.canonical_value)
+        .filter(tuple_(Entity.entity_type, Entity.canonical_value).in_(keys))
+    }
+
+    new_rows = []
+    for key, ent in zip(keys, wanted):
+        if key in existing:
+            continue
+        entity_id = uuid.uuid4()
+        existing[key] = entity_id
+        new_rows.append(
+            {
+                "id": entity_id,
+                "entity_type": key[0],
+                "value": ent.get("value") or key[1],
+                "canonical_value": key[1],
+            }
+        )
+
+    if new_rows:
+        db.execute(insert(Entity), new_rows)
+
+    return [(existing[key], ent.get("role")) for key, ent in zip(keys, wanted)]
+
+
+def _ensure_tags(db, tags: List[str]) -> List[uuid.UUID]:
+    """
+    Zoek of maak alle tags met één INSERT ... ON CONFLICT en één SELECT.
+    Dubbele namen worden ontdubbeld; de volgorde van eerste voorkomen blijft.
+    """
+    # Eén pass: strippen en ontdubbelen via dict-sleutels (volgorde blijft behouden).
+    names = list({name.strip(): None for name in tags if name and name.strip()})
+    if not names:
+        return []
+
+    db.execute(
+        pg_insert(Tag)
+        .values([{"id": uuid.uuid4(), "name": name} for name in names])
+        .on_conflict_do_nothing(index_elements=[Tag.name])
+    )
+    ids_by_name = dict(
+        db.query(Tag.name, Tag.id).filter(Tag.name.in_(names)).all()
+    )
+    return [ids_by_name[name] for name in names]
+
+
+_LIST_ITEM_COLUMNS = (
+    Note.id,
+    Note.title,
+    Note.summary,
+    Note.author,
+    Note.status,
+    Note.created_at,
+    Note.updated_at,
+)
+
+
+def list_notes(
+    limit: int = 50,
+    after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    search: Optional[str] = None,
+) -> List[NoteListItem]:
+    """
+    Haal de nieuwste notities op, pagina voor pagina.
+    `after` is de (created_at, id) van de laatste notitie van de vorige pagina;
+    met die keyset blijft elke pagina een index-scan, ongeacht hoe ver je bladert.
+    `search` filtert hoofdletterongevoelig op titel, samenvatting of auteur.
+    Geeft lichte rijen zonder inhoud terug; gebruik get_note voor de volledige notitie.
+    """
     with get_session() as db:
-        notes = (
-            db.query(Note)
-            .order_by(Note.created_at.desc())
+        query = db.query(*_LIST_ITEM_COLUMNS)
+        search = (search or "").strip()
+        if search:
+            # ILIKE met trigram-indexen (migratie 0005); % en _ uit de invoer letterlijk.
+            escaped = (
+                search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            pattern = f"%{escaped}%"
+            query = query.filter(
+                or_(
+                    Note.title.ilike(pattern, escape="\\"),
+                    Note.summary.ilike(pattern, escape="\\"),
+                    Note.author.ilike(pattern, escape="\\"),
+                )
+            )
+        if after is not None:
+            query = query.filter(tuple_(Note.created_at, Note.id) < tuple_(*after))
+        rows = (
+            query.order_by(Note.created_at.desc(), Note.id.desc())
             .limit(limit)
             .all()
         )
 
-        for note in notes:
-            db.expunge(note)
+        return [NoteListItem(*row) for row in rows]
+
+
+def get_note_items(note_ids) -> dict[str, NoteListItem]:
+    """Haal meerdere notities (zonder inhoud) in één query op, per id als string."""
+    parsed_ids = set()
+    for note_id in note_ids:
+        try:
+            parsed_ids.add(uuid.UUID(str(note_id)))
+        except (TypeError, ValueError):
+            continue
+
+    if not parsed_ids:
+        return {}
 
-        return notes
+    with get_session() as db:
+        rows = db.query(*_LIST_ITEM_COLUMNS).filter(Note.id.in_(parsed_ids)).all()
+        return {str(row.id): NoteListItem(*row) for row in rows}
 
 
 def get_note(note_id: str | uuid.UUID) -> Optional[Note]:
@@ -145,6 +268,55 @@ def get_note(note_id: str | uuid.UUID) -> Optional[Note]:
         return note
 
 
+def get_note_embedding(note_id: str | uuid.UUID) -> Optional[np.ndarray]:
+    """Geef de opgeslagen embedding van een notitie, of None als die ontbreekt."""
+    try:
+        parsed_id = uuid.UUID(str(note_id))
+    except (TypeError, ValueError):
+        return None
+
+    with get_session() as db:
+        embedding = (
+            db.query(Embedding.embedding)
+            .filter(Embedding.note_id == parsed_id)
+            .scalar()
+        )
+    if embedding is None:
+        return None
+    return np.asarray(embedding, dtype=np.float32)
+
+
+@lru_cache(maxsize=256)
+def _get_note_snapshot(
+    note_id: str, updated_at: Optional[datetime]
+) -> Optional[NoteSnapshot]:
+    note = get_note(note_id)
+    if note is None:
+        return None
+    return NoteSnapshot(
+        id=note.id,
+        title=note.title,
+        content=note.content,
+        summary=note.summary,
+        author=note.author,
+        status=note.status,
+        created_at=note.created_at,
+        updated_at=note.updated_at,
+    )
+
+
+def get_note_snapshot(
+    note_id: str | uuid.UUID, updated_at: Optional[datetime]
+) -> Optional[NoteSnapshot]:
+    """
+    Gecachete variant van get_note voor als updated_at al bekend is (bv. uit list_notes).
+    Een wijziging geeft een nieuwe updated_at en dus een nieuwe cache-sleutel.
+    De cache bevat onveranderlijke NoteSnapshot-objecten, geen ORM-notities, zodat
+    gebruikers die een gedeelde snapshot niet per ongeluk kunnen wijzigen.
+    """
+    return _get_note_snapshot(str(note_id), updated_at)
+
+
 def delete_note(note_id: str | uuid.UUID) -> None:
     """Verwijdert een notitie en bijbehorende gegevens."""
     if not note_id:
@@ -164,8 +336,45 @@ def delete_note(note_id: str | uuid.UUID) -> None:
         db.commit()
 
 
+@lru_cache(maxsize=1)
+def _pgvector_version() -> Tuple[int, ...]:
+    # Eigen verbinding i.p.v. get_session(): die geeft de thread-lokale sessie van
+    # de aanroeper terug, en het sluiten ervan zou diens transactie (en SET LOCAL)
+    # afbreken.
+    with get_engine().connect() as conn:
+        version = conn.execute(
+            text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        ).scalar()
+
+    parts = []
+    for part in (version or "").split("-")[0].split("."):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+def _filtered_distance(db, embedding: np.ndarray):
+    """
+    Cosine-afstand voor een gefilterde zoekopdracht. De HNSW-index (migratie 0004)
+    levert standaard hnsw.ef_search=40 kandidaten en pas daarna filtert Postgres
+    op status en entiteiten, zodat een selectief filter te weinig of geen rijen
+    overhoudt. Vanaf pgvector 0.8 scant de index door tot de LIMIT gevuld is (SET
+    LOCAL: alleen deze transactie). Op 0.7 kan dat niet en maakt "+ 0" de
+    sorteersleutel onbruikbaar voor de index, zodat de scan exact blijft.
+    """
+    distance = Embedding.embedding.cosine_distance(embedding)
+    version = _pgvector_version()
+    if version >= (0, 8):
+        # strict_order houdt de volgorde exact, zodat ORDER BY distance klopt.
+        db.execute(text("SET LOCAL hnsw.iterative_scan = strict_order"))
+    elif version >= (0, 7):
+        distance = distance + 0
+    return distance.label("distance")
+
+
 def search_notes_by_similarity(
-    embedding: List[float],
+    embedding: np.ndarray,
     *,
     limit: int = 5,
     entity_type: Optional[str] = None,
@@ -173,61 +382,53 @@ def search_notes_by_similarity(
 ) -> List[NoteSearchResult]:
     """Zoek notities op basis van embedding-similarity met optionele entiteitfilters."""
 
-    if not embedding:
+    if embedding is None or len(embedding) == 0:
         return []
 
-    max_candidates = max(limit * 4, limit)
-    distance_expr = Embedding.embedding.cosine_distance(embedding)
-
     with get_session() as db:
+        # ORDER BY verwijst naar het label: de afstand (en de vector-parameter)
+        # wordt één keer berekend.
+        distance_col = _filtered_distance(db, embedding)
         query = (
-            db.query(Note, (1 - distance_expr).label("score"))
+            db.query(Note, distance_col)
             .join(Embedding, Embedding.note_id == Note.id)
-            .options(joinedload(Note.entities).joinedload(NoteEntity.entity))
+            .options(selectinload(Note.entities).joinedload(NoteEntity.entity))
             .filter(Note.status == "published")
-            .order_by(distance_expr)
-            .limit(max_candidates)
         )
 
-        rows = query.all()
-        results: List[NoteSearchResult] = []
-
+        # Entiteitfilters als EXISTS in SQL; samen met _filtered_distance geldt de
+        # LIMIT dan voor de gefilterde notities, zonder overfetch of filterlus in
+        # Python. Type en canonical_value zijn sinds migratie 0006/0007 getrimd en
+        # het type is lowercase; waarden vergelijken we hoofdletterongevoelig via
+        # lower(canonical_value), waarvoor 0007 een expressie-index aanlegt.
         normalized_type = (entity_type or "").strip().lower()
-        normalized_values = {
-            value.strip().lower()
-            for value in (entity_values or [])
-            if value and value.strip()
-        }
-
-        for note, score in rows:
-            if normalized_type:
-                relevant_links = [
-                    link
-                    for link in note.entities
-                    if link.entity
-                    and (link.entity.entity_type or "").strip().lower() == normalized_type
-                ]
-                if not relevant_links:
-                    continue
-
-                if normalized_values:
-                    note_values = {
-                        (link.entity.canonical_value or link.entity.value or "")
-                        .strip()
-                        .lower()
-                        for link in relevant_links
-                    }
-                    if not normalized_values.issubset(note_values):
-                        continue
-
-            results.append(
-                NoteSearchResult(note=note, score=float(score) if score is not None else 0.0)
+        if normalized_type:
+            type_match = Entity.entity_type == normalized_type
+            normalized_values = {
+                value.strip().lower()
+                for value in (entity_values or [])
+                if value and value.strip()
+            }
+            if not normalized_values:
+                query = query.filter(_has_entity_matching(type_match))
+            for value in normalized_values:
+                value_match = func.lower(Entity.canonical_value) == value
+                query = query.filter(_has_entity_matching(type_match, value_match))
+
+        rows = query.order_by(distance_col).limit(limit).all()
+
+        return [
+            NoteSearchResult(
+                note=note,
+                score=1.0 - float(distance) if distance is not None else 0.0,
             )
+            for note, distance in rows
+        ]
 
-            if len(results) >= limit:
-                break
 
-        return results
+def _has_entity_matching(*conditions):
+    """EXISTS-filter: de notitie heeft een entiteit die aan alle condities voldoet."""
+    return Note.entities.any(NoteEntity.entity.has(and_(*conditions)))
 
 
 def search_question_matches(
@@ -244,7 +445,7 @@ def search_question_matches(
         raise ValueError("Vul een vraag in om te zoeken.")
 
     embedding = embed_text(question_clean)
-    if not embedding:
+    if embedding is None:
         raise RuntimeError("Kon geen embedding maken voor deze vraag.")
 
     raw_results = search_notes_by_similarity(
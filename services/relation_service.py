@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import uuid
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
+import numpy as np
+from sqlalchemy import insert
 from sqlalchemy.orm import joinedload, load_only
 
 from core.db_client import get_session
@@ -12,8 +14,10 @@ from models.note_model import Note
 from models.relation_model import NoteRelation, RelationSuggestion
 
 
-def suggest_relations(embedding: List[float], limit: int = 5) -> List[RelationSuggestion]:
-    distance_expr = Embedding.embedding.cosine_distance(embedding)
+def suggest_relations(embedding: np.ndarray, limit: int = 5) -> List[RelationSuggestion]:
+    # Eén gelabelde afstand: de vector wordt één keer gebonden en ORDER BY
+    # verwijst naar het label in plaats van de afstand opnieuw te berekenen.
+    distance_col = Embedding.embedding.cosine_distance(embedding).label("distance")
 
     with get_session() as db:
         q = (
@@ -22,10 +26,10 @@ def suggest_relations(embedding: List[float], limit: int = 5) -> List[RelationSu
                 Note.title,
                 Note.summary,
                 Note.status,
-                (1 - distance_expr).label("score"),
+                distance_col,
             )
             .join(Embedding, Note.id == Embedding.note_id)
-            .order_by(distance_expr)
+            .order_by(distance_col)
             .limit(limit)
         )
 
@@ -35,18 +39,17 @@ def suggest_relations(embedding: List[float], limit: int = 5) -> List[RelationSu
                 title=row.title,
                 summary=row.summary,
                 status=row.status,
-                score=float(row.score),
+                score=1.0 - float(row.distance),
             )
             for row in q.all()
         ]
 
 
 def suggest_relations_for_embedding(
-    embedding: List[float],
+    embedding: np.ndarray,
     limit: int = 5,
 ) -> List[RelationSuggestion]:
-    with get_session() as db:
-        return suggest_relations(embedding, limit=limit)
+    return suggest_relations(embedding, limit=limit)
 
 def create_relation(
     source_note_id: str,
@@ -111,6 +114,32 @@ def create_relation_entry(
     return relation
 
 
+def create_relation_entries(
+    source_note_id: str,
+    targets: Iterable[Tuple[str, str]],
+    confidence: float | None = None,
+) -> int:
+    """Maak alle relaties vanuit één bronnotitie in één multi-row INSERT."""
+    source_id = uuid.UUID(str(source_note_id))
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "source_note_id": source_id,
+            "target_note_id": uuid.UUID(str(target_note_id)),
+            "relation_type": relation_type,
+            "confidence": confidence,
+        }
+        for target_note_id, relation_type in targets
+    ]
+    if not rows:
+        return 0
+
+    with get_session() as db:
+        db.execute(insert(NoteRelation), rows)
+        db.commit()
+    return len(rows)
+
+
 def update_relation_type(relation_id: str, relation_type: str) -> NoteRelation:
     """Werk de relatie bij met een nieuw type en geef een gedetacheerde instantie terug."""
     if not relation_id:
@@ -194,3 +223,31 @@ def list_relations_for_notes(note_ids: Iterable[str]) -> List[NoteRelation]:
             db.expunge(relation)
 
         return relations
+
+
+def list_relation_edges(note_ids: Iterable[str]) -> list:
+    """
+    Relaties waarvan beide notities in `note_ids` zitten, als lichte rijen
+    (source_note_id, target_note_id, relation_type) zonder geladen notities.
+    Bedoeld voor de relatiegraaf; titels en status komen uit de al geladen lijst.
+    """
+    try:
+        normalized_ids = {uuid.UUID(str(note_id)) for note_id in note_ids}
+    except (TypeError, ValueError):
+        return []
+    if not normalized_ids:
+        return []
+
+    with get_session() as db:
+        return (
+            db.query(
+                NoteRelation.source_note_id,
+                NoteRelation.target_note_id,
+                NoteRelation.relation_type,
+            )
+            .filter(
+                NoteRelation.source_note_id.in_(normalized_ids),
+                NoteRelation.target_note_id.in_(normalized_ids),
+            )
+            .all()
+        )
@@ -1,13 +1,20 @@
 # app/services/summaries.py
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from pydantic import BaseModel
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from infrastructure.llm.llm_utils import llm_chat_structured
 
 
+# Tot deze lengte past een notitie ruim in de context van het chatmodel; één
+# call is dan sneller en goedkoper dan per chunk samenvatten plus combineren.
+SINGLE_CALL_MAX_CHARS = 24000
+
+
 # ----------------------------------------------------------------------
 # Structured output schema
 # ----------------------------------------------------------------------
@@ -18,12 +25,23 @@ class SummaryResponse(BaseModel):
 # ----------------------------------------------------------------------
 # Public API
 # ----------------------------------------------------------------------
-def summarize(text: str, max_chars: int = 6000) -> str:
+def summarize(
+    text: str,
+    max_chars: int = 6000,
+    single_call_max_chars: int = SINGLE_CALL_MAX_CHARS,
+) -> str:
     """
-    Vat tekst bondig samen. Grote teksten worden in chunks verwerkt.
+    Vat tekst bondig samen. Tekst tot `single_call_max_chars` gaat in één call;
+    grotere teksten worden in chunks van `max_chars` verwerkt en gecombineerd.
     """
-    chunks = _split_chunks(text, max_chars=max_chars)
-    partials: List[str] = [_summarize_chunk(c) for c in chunks if c]
+    cleaned = (text or "").strip()
+    if not cleaned:
+        return ""
+    if len(cleaned) <= single_call_max_chars:
+        return _summarize_chunk(cleaned)
+
+    chunks = _split_chunks(cleaned, max_chars=max_chars)
+    partials: List[str] = _summarize_chunks(chunks)
 
     if not partials:
         return ""
@@ -56,6 +74,20 @@ def _split_chunks(text: str, max_chars: int = 6000) -> List[str]:
     return chunks
 
 
+def _summarize_chunks(chunks: List[str], max_workers: int = 4) -> List[str]:
+    """Vat chunks parallel samen; de calls zijn onafhankelijk en netwerkgebonden."""
+    if len(chunks) <= 1:
+        return [_summarize_chunk(c) for c in chunks]
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(chunks)),
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx),
+    ) as executor:
+        return list(executor.map(_summarize_chunk, chunks))
+
+
 def _summarize_chunk(chunk: str) -> str:
     parsed = llm_chat_structured(
         [
@@ -0,0 +1,35 @@
+"""
+Gedeelde testinstellingen.
+
+Databasetests draaien alleen als ZORGWAARD_TEST_DB_NAME naar een wegwerpdatabase
+wijst: de migraties worden erop uitgevoerd en de tests schrijven notities weg.
+Overige DB_*-variabelen komen uit de omgeving of .env. Zonder die variabele
+draaien alleen de pure tests; de services importeren dan met dummy-settings,
+want engine en verbindingen worden pas bij gebruik aangemaakt.
+"""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+TEST_DB_NAME = os.getenv("ZORGWAARD_TEST_DB_NAME")
+
+# Moet vóór de eerste import van core.config: settings en engine zijn lazy,
+# maar worden daarna per proces gecachet.
+if TEST_DB_NAME:
+    os.environ["DB_NAME"] = TEST_DB_NAME
+    # Forceer het plan van een grote tabel: ORDER BY via de HNSW-index. Op de
+    # kleine testtabellen kiest de planner anders scan + sort en blijft een te
+    # vroeg afgekapte kandidatenlijst onzichtbaar.
+    os.environ["PGOPTIONS"] = (
+        "-c enable_seqscan=off -c enable_bitmapscan=off -c enable_sort=off"
+    )
+else:
+    os.environ.setdefault("DB_USER", "niet-gebruikt")
+    os.environ.setdefault("DB_PASSWORD", "niet-gebruikt")
+os.environ.setdefault("OPENAI_API_KEY", "niet-gebruikt")
+
+requires_db = pytest.mark.skipif(
+    not TEST_DB_NAME, reason="ZORGWAARD_TEST_DB_NAME is niet gezet"
+)
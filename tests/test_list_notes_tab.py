@@ -0,0 +1,27 @@
+"""Pure tests voor de grafiek-layout in de notitielijst; geen database nodig."""
+from __future__ import annotations
+
+import math
+
+from ui.list_notes_tab import _compute_static_layout
+
+
+def test_static_layout_places_every_node_with_hub_at_origin():
+    node_ids = ("a", "b", "c", "d", "e")
+    edge_pairs = (("a", "c"), ("b", "c"), ("c", "d"), ("d", "e"))
+
+    positions = _compute_static_layout(node_ids, edge_pairs)
+
+    assert set(positions) == set(node_ids)
+    assert positions["c"] == (0.0, 0.0)
+    assert all(
+        math.hypot(*positions[node_id]) > 0 for node_id in node_ids if node_id != "c"
+    )
+    assert len(set(positions.values())) == len(node_ids)
+
+
+def test_static_layout_places_isolated_nodes():
+    positions = _compute_static_layout(("x", "y"), ())
+
+    assert set(positions) == {"x", "y"}
+    assert positions["x"] == (0.0, 0.0)
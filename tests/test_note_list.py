@@ -0,0 +1,103 @@
+"""
+Integratietests voor list_notes: zoeken met ILIKE en keyset-paginering.
+Zie conftest.py voor ZORGWAARD_TEST_DB_NAME.
+"""
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from conftest import requires_db
+
+pytestmark = requires_db
+
+
+@pytest.fixture
+def notes():
+    from core.db_client import init_db
+    from services.note_service import create_note, delete_note
+
+    init_db()
+    marker = f"test-{uuid.uuid4()}"
+    note_ids = []
+
+    def add(label: str) -> uuid.UUID:
+        note = create_note(
+            title=f"{marker} {label}",
+            content=label,
+            summary="",
+            author="test",
+        )
+        note_ids.append(note.id)
+        return note.id
+
+    yield marker, add
+
+    for note_id in note_ids:
+        delete_note(note_id)
+
+
+def _titles(items) -> set[str]:
+    return {item.title for item in items}
+
+
+def test_search_treats_wildcards_literally(notes):
+    from services.note_service import list_notes
+
+    marker, add = notes
+    for label in ("50% korting", "50 euro", "a_b", "axb"):
+        add(label)
+
+    assert _titles(list_notes(search=f"{marker} 50%")) == {f"{marker} 50% korting"}
+    assert _titles(list_notes(search=f"{marker} a_b")) == {f"{marker} a_b"}
+
+
+def _all_pages(search: str, limit: int) -> list:
+    from services.note_service import list_notes
+
+    items, after = [], None
+    while True:
+        page = list_notes(limit=limit, after=after, search=search)
+        items.extend(page)
+        if len(page) < limit:
+            return items
+        after = (page[-1].created_at, page[-1].id)
+
+
+def test_keyset_paging_crosses_page_boundary(notes):
+    from services.note_service import list_notes
+
+    marker, add = notes
+    for idx in range(5):
+        add(f"pagina {idx}")
+
+    paged = _all_pages(marker, limit=2)
+
+    assert [item.id for item in paged] == [
+        item.id for item in list_notes(limit=10, search=marker)
+    ]
+    assert [item.title for item in paged] == [
+        f"{marker} pagina {idx}" for idx in range(4, -1, -1)
+    ]
+
+
+def test_created_at_ties_are_ordered_by_id(notes):
+    from core.db_client import get_session
+    from models.note_model import Note
+    from services.note_service import list_notes
+
+    marker, add = notes
+    note_ids = [add(f"gelijk {idx}") for idx in range(4)]
+    # Alle notities op hetzelfde tijdstip: alleen id kan de volgorde bepalen.
+    with get_session() as db:
+        db.query(Note).filter(Note.id.in_(note_ids)).update(
+            {Note.created_at: datetime(2024, 1, 1, tzinfo=timezone.utc)},
+            synchronize_session=False,
+        )
+        db.commit()
+
+    expected = sorted(note_ids, reverse=True)
+    assert [item.id for item in list_notes(limit=10, search=marker)] == expected
+    assert [item.id for item in _all_pages(marker, limit=1)] == expected
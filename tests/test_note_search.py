@@ -0,0 +1,133 @@
+"""
+Integratietests voor de similarity search tegen een echte PostgreSQL + pgvector.
+Zie conftest.py voor ZORGWAARD_TEST_DB_NAME.
+"""
+from __future__ import annotations
+
+import uuid
+
+import numpy as np
+import pytest
+
+from conftest import requires_db
+
+pytestmark = requires_db
+
+EMBED_DIM = 3072
+DECOYS = 200
+MATCHES = 10
+LIMIT = 5
+
+
+def _near(axis: int, rng: np.random.Generator) -> np.ndarray:
+    vector = rng.normal(scale=0.01, size=EMBED_DIM).astype(np.float32)
+    vector[axis] += 1.0
+    return vector
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    from core.db_client import init_db
+    from services.note_service import create_note, delete_note
+
+    init_db()
+    rng = np.random.default_rng(42)
+    marker = f"test-{uuid.uuid4()}"
+    note_ids = []
+
+    def add(label: str, status: str, axis: int, entities=None) -> None:
+        note = create_note(
+            title=f"{marker} {label}",
+            content=label,
+            summary="",
+            author=marker,
+            status=status,
+            embedding=_near(axis, rng),
+            entities=entities,
+        )
+        note_ids.append(note.id)
+
+    # Concepten vlak bij de vraag vullen de eerste ef_search kandidaten, maar
+    # vallen af op status. Gepubliceerde notities zijn zo talrijk dat de status
+    # niet selectief is en de planner de vectorindex voor de ORDER BY kiest.
+    for idx in range(DECOYS):
+        add(f"concept {idx}", "draft", axis=0)
+        add(f"gepubliceerd {idx}", "published", axis=1)
+    # Gepubliceerde treffers met een eigen entiteit, het verst van de vraag.
+    for idx in range(MATCHES):
+        add(
+            f"treffer {idx}",
+            "published",
+            axis=2,
+            entities=[{"entity_type": "App", "value": marker}],
+        )
+
+    # Dezelfde waarde met afwijkende spaties en hoofdletters.
+    for idx, value in enumerate([f" {marker}-Wijkteam ", f"{marker}-wijkteam"]):
+        add(
+            f"variant {idx}",
+            "published",
+            axis=2,
+            entities=[{"entity_type": " App", "value": value}],
+        )
+
+    yield marker, _near(0, rng)
+
+    for note_id in note_ids:
+        delete_note(note_id)
+
+
+def test_status_filter_fills_limit(corpus):
+    from services.note_service import search_notes_by_similarity
+
+    _, question = corpus
+    results = search_notes_by_similarity(question, limit=LIMIT)
+
+    assert len(results) == LIMIT
+    assert all(result.note.status == "published" for result in results)
+
+
+def test_entity_filter_fills_limit(corpus):
+    from services.note_service import search_notes_by_similarity
+
+    marker, question = corpus
+    results = search_notes_by_similarity(
+        question, limit=LIMIT, entity_type="app", entity_values=[marker]
+    )
+
+    assert len(results) == LIMIT
+    assert all(result.note.title.startswith(f"{marker} treffer") for result in results)
+    scores = [result.score for result in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_entity_filter_ignores_padding_and_case(corpus):
+    from services.note_service import search_notes_by_similarity
+
+    marker, question = corpus
+    results = search_notes_by_similarity(
+        question,
+        limit=LIMIT,
+        entity_type="APP ",
+        entity_values=[f"  {marker.upper()}-WIJKTEAM"],
+    )
+
+    assert sorted(result.note.content for result in results) == [
+        "variant 0",
+        "variant 1",
+    ]
+
+
+def test_version_probe_keeps_caller_session_open(corpus):
+    from core.db_client import get_session
+    from models.note_model import Note
+    from services.note_service import _filtered_distance, _pgvector_version
+
+    marker, question = corpus
+    _pgvector_version.cache_clear()
+    with get_session() as db:
+        note = db.query(Note).filter(Note.author == marker).first()
+        _filtered_distance(db, question)
+
+        # Eerste aanroep vraagt de versie op; de sessie van de aanroeper blijft open.
+        assert note in db
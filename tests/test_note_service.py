@@ -0,0 +1,77 @@
+"""Pure tests voor hulpfuncties in de note-service; geen database nodig."""
+from __future__ import annotations
+
+import dataclasses
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from models.note_model import Note, NoteSnapshot
+from services import note_service
+from services.note_service import _entity_key, _unique_entities
+
+
+def test_unique_entities_ignores_padding_and_type_case():
+    entities = [
+        {"entity_type": "App", "value": "Wijkteam ", "role": "eerste"},
+        {"entity_type": " app", "value": "Wijkteam", "role": "tweede"},
+        {"entity_type": "app", "value": "x", "canonical_value": " Wijkteam"},
+    ]
+
+    unique = _unique_entities(entities)
+
+    assert len(unique) == 1
+    assert unique[0]["role"] == "eerste"
+    assert _entity_key(unique[0]) == ("app", "Wijkteam")
+
+
+def test_unique_entities_keeps_distinct_values_in_order():
+    entities = [
+        {"entity_type": "rol", "value": "Wijkverpleegkundige"},
+        {"entity_type": "app", "value": "Knox"},
+        {"entity_type": "rol", "value": "Knox"},
+        {"entity_type": "", "value": "Knox"},
+    ]
+
+    unique = _unique_entities(entities)
+
+    assert [_entity_key(ent) for ent in unique] == [
+        ("rol", "Wijkverpleegkundige"),
+        ("app", "Knox"),
+        ("rol", "Knox"),
+        ("onbekend", "Knox"),
+    ]
+
+
+def test_entity_key_falls_back_to_value_for_blank_canonical():
+    entity = {"entity_type": "app", "value": " Knox ", "canonical_value": "  "}
+
+    assert _entity_key(entity) == ("app", "Knox")
+
+
+def test_note_snapshot_is_frozen_copy(monkeypatch):
+    note_id = uuid.uuid4()
+    updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    note = Note(
+        id=note_id,
+        title="Titel",
+        content="Inhoud",
+        summary="",
+        author="Auteur",
+        status="draft",
+        created_at=updated_at,
+        updated_at=updated_at,
+    )
+    monkeypatch.setattr(note_service, "get_note", lambda _note_id: note)
+    note_service._get_note_snapshot.cache_clear()
+
+    snapshot = note_service.get_note_snapshot(note_id, updated_at)
+    note.title = "Gewijzigd"
+
+    assert isinstance(snapshot, NoteSnapshot)
+    assert snapshot.title == "Titel"
+    assert note_service.get_note_snapshot(note_id, updated_at) is snapshot
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.title = "Anders"
+    note_service._get_note_snapshot.cache_clear()
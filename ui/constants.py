@@ -0,0 +1,39 @@
+# Relatie-labels en -opties, gedeeld door de tabbladen zonder dat het ene tabblad
+# het andere hoeft te importeren (app.py laadt "Alle notities" pas bij gebruik).
+
+RELATION_TYPE_LABELS = {
+    "supports": "Ondersteunt",
+    "contradicts": "Spreekt tegen",
+    "supersedes": "Vervangt",
+    "related": "Gerelateerd",
+    "duplicate": "Duplicaat",
+}
+
+DEFAULT_RELATION_LABEL = "Geen relatie"
+
+RELATION_TYPE_ORDER = [
+    "supports",
+    "contradicts",
+    "supersedes",
+    "related",
+    "duplicate",
+]
+RELATION_TYPE_OPTIONS = [
+    DEFAULT_RELATION_LABEL,
+    *[RELATION_TYPE_LABELS.get(value, value) for value in RELATION_TYPE_ORDER],
+]
+RELATION_LABEL_TO_TYPE = {label: key for key, label in RELATION_TYPE_LABELS.items()}
+RELATION_LABEL_TO_TYPE[DEFAULT_RELATION_LABEL] = ""
+RELATION_OPTION_INDEX = {
+    label: idx for idx, label in enumerate(RELATION_TYPE_OPTIONS)
+}
+
+RELATION_HELP_TEXT = """
+<div style='line-height:1.2; font-size:0.9em; color:gray; margin-bottom:10px;'>
+<b>Ondersteunt</b> – bevestigt of versterkt andere notitie (bv. handleiding bevestigt procedure)<br>
+<b>Spreekt tegen</b> – inhoud is tegenstrijdig (bv. A zegt RAM IT, B zegt Zorgwaard)<br>
+<b>Vervangt</b> – nieuwe versie vervangt de oude (bv. Knox v3 vervangt Knox v2)<br>
+<b>Gerelateerd</b> – zelfde thema, geen bewijs (bv. Knox-account vs MFA-procedure)<br>
+<b>Duplicaat</b> – inhoud (bijna) hetzelfde
+</div>
+"""
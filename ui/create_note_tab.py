@@ -1,33 +1,38 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 
 from infrastructure.llm import entities
 from infrastructure.llm.llm_utils import embed_text
 from services.note_service import create_note
 from services.relation_service import (
-    create_relation_entry,
+    create_relation_entries,
     suggest_relations_for_embedding,
 )
 from services.summary_service import summarize
+from ui.constants import (
+    DEFAULT_RELATION_LABEL,
+    RELATION_HELP_TEXT,
+    RELATION_LABEL_TO_TYPE,
+    RELATION_TYPE_OPTIONS,
+)
+from ui.search_tab import clear_entity_cache
 
-DEFAULT_RELATION_LABEL = "Geen relatie"
-
-RELATION_TYPE_MAP = {
-    "Ondersteunt": "supports",
-    "Spreekt tegen": "contradicts",
-    "Vervangt": "supersedes",
-    "Gerelateerd": "related",
-    "Duplicaat": "duplicate",
+STATUS_MAP = {
+    "Gepubliceerd": "published",
+    "Concept": "draft",
+    "Archief": "archived",
 }
 
-RELATION_TYPE_OPTIONS = [
-    DEFAULT_RELATION_LABEL,
-    *RELATION_TYPE_MAP.keys(),
-]
+STATUS_OPTIONS = list(STATUS_MAP.keys())
 
 
 def render():
+    if _render_pending_save():
+        return
+
     formContainer, suggestionsContainer = st.columns([5, 3])
 
     with formContainer:
@@ -39,26 +44,21 @@ def render():
         content = st.text_area("Inhoud", height=200, key="create-note-content")
         status_display = st.selectbox(
             "Status",
-            ["Gepubliceerd", "Concept", "Archief"],
+            STATUS_OPTIONS,
             key="create-note-status",
         )
-        status_map = {
-            "Gepubliceerd": "published",
-            "Concept": "draft",
-            "Archief": "archived",
-        }
-        status = status_map[status_display]
+        status = STATUS_MAP[status_display]
 
-    content_embedding = None
+    cleaned_content = content.strip()
     relation_suggestions = []
 
-    if content.strip():
-        relation_suggestions = _get_relation_suggestions(content)
+    if cleaned_content:
+        relation_suggestions = _get_relation_suggestions(cleaned_content)
 
     with suggestionsContainer:
         st.markdown("### Relaties")
 
-        if not content.strip():
+        if not cleaned_content:
             st.caption("Schrijf eerst inhoud om relaties te zien.")
         elif not relation_suggestions:
             st.info("Geen relatie-suggesties gevonden.")
@@ -76,66 +76,181 @@ def render():
                         RELATION_TYPE_OPTIONS,
                         key=choice_key,
                     )
-                    st.markdown(
-                        """
-                        <div style='line-height:1.2; font-size:0.9em; color:gray; margin-bottom:10px;'>
-                        <b>Ondersteunt</b> – bevestigt of versterkt andere notitie (bv. handleiding bevestigt procedure)<br>
-                        <b>Spreekt tegen</b> – inhoud is tegenstrijdig (bv. A zegt RAM IT, B zegt Zorgwaard)<br>
-                        <b>Vervangt</b> – nieuwe versie vervangt de oude (bv. Knox v3 vervangt Knox v2)<br>
-                        <b>Gerelateerd</b> – zelfde thema, geen bewijs (bv. Knox-account vs MFA-procedure)<br>
-                        <b>Duplicaat</b> – inhoud (bijna) hetzelfde
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
-                    )
+                    st.markdown(RELATION_HELP_TEXT, unsafe_allow_html=True)
 
     if st.button("Opslaan", type="primary"):
-        if not title.strip() or not content.strip() or not author.strip():
+        if not title.strip() or not cleaned_content or not author.strip():
             st.warning("Titel, inhoud en auteur zijn verplicht.")
             return
 
-        summary = summarize(content)
-        ent_suggestions = entities.suggest_entities(content)
-        embedding_for_note = content_embedding or embed_text(content)
+        relation_choices = []
+        for suggestion in relation_suggestions:
+            choice_key = f"relation-choice-{suggestion.note_id}"
+            relation_type = st.session_state.get(choice_key, DEFAULT_RELATION_LABEL)
+            relation_value = RELATION_LABEL_TO_TYPE.get(relation_type)
+            if relation_value:
+                relation_choices.append((suggestion.note_id, relation_value))
+
+        embedding_cache = st.session_state.get("create-note-embedding-cache", {})
+        known_embedding = (
+            embedding_cache.get("embedding")
+            if embedding_cache.get("content") == cleaned_content
+            else None
+        )
 
-        note = create_note(
+        st.session_state["create-note-save-input"] = {
+            "create-note-title": title,
+            "create-note-author": author,
+            "create-note-content": content,
+            "create-note-status": status_display,
+        }
+        st.session_state["create-note-save-future"] = _save_executor().submit(
+            _save_note,
             title=title,
-            content=content,
-            summary=summary,
+            content=cleaned_content,
             author=author,
             status=status,
-            embedding=embedding_for_note,
-            entities=ent_suggestions,
-            tags=[],
+            embedding=known_embedding,
+            relations=relation_choices,
+        )
+        st.rerun()
+
+
+@st.cache_resource
+def _save_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="note-save")
+
+
+def _save_note(
+    *,
+    title: str,
+    content: str,
+    author: str,
+    status: str,
+    embedding,
+    relations: list[tuple[str, str]],
+) -> dict:
+    """
+    Verrijk en bewaar een notitie. Draait in de achtergrond-executor, zonder
+    ScriptRunContext: st.error in de LLM-helpers is hier onzichtbaar, dus
+    fouten komen terug via een exceptie of de lijst `warnings`.
+    """
+    if embedding is None:
+        embedding = embed_text(content)
+    if embedding is None:
+        # Zonder embedding is de notitie nooit vindbaar via similarity search;
+        # liever niet opslaan, dan kan de gebruiker het opnieuw proberen.
+        raise RuntimeError("Kon geen embedding maken voor deze notitie.")
+
+    summary, ent_suggestions = _enrich_content(content)
+
+    warnings = []
+    if not summary:
+        warnings.append(
+            "Samenvatting kon niet worden gemaakt; de notitie heeft er geen."
+        )
+    if not ent_suggestions:
+        warnings.append("Geen entiteiten gevonden (mogelijk door een LLM-fout).")
+
+    note = create_note(
+        title=title,
+        content=content,
+        summary=summary,
+        author=author,
+        status=status,
+        embedding=embedding,
+        entities=ent_suggestions,
+        tags=[],
+    )
+
+    relation_count = create_relation_entries(str(note.id), relations)
+
+    return {
+        "title": note.title,
+        "summary": summary,
+        "entities": ent_suggestions,
+        "relation_count": relation_count,
+        "warnings": warnings,
+    }
+
+
+def _render_pending_save() -> bool:
+    """Toon de status van een lopende opslag. Geeft True zolang die nog loopt."""
+    future = st.session_state.get("create-note-save-future")
+    if future is None:
+        return False
+
+    if not future.done():
+        _poll_pending_save()
+        return True
+
+    st.session_state.pop("create-note-save-future", None)
+    form_input = st.session_state.pop("create-note-save-input", {})
+    try:
+        result = future.result()
+    except Exception as exc:  # pragma: no cover - defensief voor UI feedback
+        # Het formulier is tijdens het opslaan niet getoond; zet de invoer terug.
+        st.session_state.update(form_input)
+        st.error(f"Opslaan mislukt: {exc}")
+        return False
+
+    clear_entity_cache()
+    _reset_form_state()
+
+    st.success(f"✅ Notitie opgeslagen: {result['title']}")
+    for warning in result["warnings"]:
+        st.warning(warning)
+    st.json({"summary": result["summary"], "entities": result["entities"]})
+
+    if result["relation_count"]:
+        st.success(
+            f"{result['relation_count']} relatie(s) toegevoegd voor deze concept-notitie."
         )
+    return False
 
-        created_relations = []
-        if relation_suggestions:
-            for suggestion in relation_suggestions:
-                choice_key = f"relation-choice-{suggestion.note_id}"
-                relation_type = st.session_state.get(
-                    choice_key, DEFAULT_RELATION_LABEL
-                )
-                relation_value = RELATION_TYPE_MAP.get(relation_type)
-                if not relation_value:
-                    continue
 
-                relation = create_relation_entry(
-                    source_note_id=str(note.id),
-                    target_note_id=suggestion.note_id,
-                    relation_type=relation_value,
-                )
-                created_relations.append(relation)
+@st.fragment(run_every=1.0)
+def _poll_pending_save() -> None:
+    future = st.session_state.get("create-note-save-future")
+    if future is None or future.done():
+        st.rerun()
+
+    st.info("⏳ Notitie wordt opgeslagen en verrijkt...")
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_summary(content: str) -> str:
+    return summarize(content)
+
 
-        st.success(f"✅ Notitie opgeslagen: {note.title}")
-        st.json({"summary": summary, "entities": ent_suggestions})
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_entities(content: str) -> list[dict]:
+    return entities.suggest_entities(content)
 
-        if created_relations:
-            st.success(
-                f"{len(created_relations)} relatie(s) toegevoegd voor deze concept-notitie."
-            )
 
-        _reset_form_state()
+def _get_summary(content: str) -> str:
+    summary = _cached_summary(content)
+    if not summary:
+        # Mislukte LLM-call niet bewaren, anders blijft de lege samenvatting hangen.
+        _cached_summary.clear(content)
+    return summary
+
+
+def _get_entities(content: str) -> list[dict]:
+    found = _cached_entities(content)
+    if not found:
+        # Leeg kan ook een mislukte call zijn; opnieuw proberen is goedkoper dan
+        # een uur lang zonder entiteiten opslaan.
+        _cached_entities.clear(content)
+    return found
+
+
+def _enrich_content(content: str) -> tuple[str, list[dict]]:
+    """Vraag samenvatting en entiteiten tegelijk op; beide zijn losse LLM-calls."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        summary_future = executor.submit(_get_summary, content)
+        entities_future = executor.submit(_get_entities, content)
+        return summary_future.result(), entities_future.result()
 
 
 def _get_content_embedding(content: str | None):
@@ -153,12 +268,16 @@ def _get_content_embedding(content: str | None):
 
 
 def _get_relation_suggestions(content: str, limit: int = 10):
+    # Alleen op de inhoud gesleuteld: st.text_area rerunt pas bij blur of
+    # Ctrl+Enter, dus elke nieuwe inhoud is een bewuste wijziging die verse
+    # suggesties verdient. Andere reruns (statuswissel, relatiekeuze) hergebruiken
+    # de vorige lijst.
     cache = st.session_state.setdefault("create-note-suggestion-cache", {})
     if cache.get("content") == content:
         return cache.get("suggestions", [])
 
     embedding = _get_content_embedding(content)
-    if not embedding:
+    if embedding is None:
         return []
     suggestions = suggest_relations_for_embedding(embedding, limit=limit)
 
@@ -168,6 +287,10 @@ def _get_relation_suggestions(content: str, limit: int = 10):
 
 
 def _sync_relation_choice_state(suggestions):
+    # De suggestiecache geeft bij ongewijzigde inhoud hetzelfde lijstobject terug
+    if st.session_state.get("create-note-relation-source") is suggestions:
+        return
+
     tracked_keys = set(st.session_state.get("create-note-relation-keys", []))
     current_keys = {f"relation-choice-{s.note_id}" for s in suggestions}
 
@@ -178,6 +301,7 @@ def _sync_relation_choice_state(suggestions):
         st.session_state.setdefault(key, DEFAULT_RELATION_LABEL)
 
     st.session_state["create-note-relation-keys"] = list(current_keys)
+    st.session_state["create-note-relation-source"] = suggestions
 
 
 def _reset_form_state():
@@ -194,6 +318,7 @@ def _reset_form_state():
         "create-note-embedding-cache",
         "create-note-suggestion-cache",
         "create-note-relation-keys",
+        "create-note-relation-source",
     ]:
         st.session_state.pop(cache_key, None)
 
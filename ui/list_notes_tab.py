@@ -1,16 +1,33 @@
+import math
+from collections import Counter
+
 import streamlit as st
 from streamlit_agraph import Config, Edge, Node, agraph
 
 from infrastructure.llm.llm_utils import embed_text
-from services.note_service import delete_note, get_note, list_notes
+from services.note_service import (
+    delete_note,
+    get_note_embedding,
+    get_note_items,
+    get_note_snapshot,
+    list_notes,
+)
 from services.relation_service import (
     create_relation_entry,
     delete_relation,
+    list_relation_edges,
     list_relations_for_note,
-    list_relations_for_notes,
     suggest_relations_for_embedding,
     update_relation_type,
 )
+from ui.constants import (
+    DEFAULT_RELATION_LABEL,
+    RELATION_HELP_TEXT,
+    RELATION_LABEL_TO_TYPE,
+    RELATION_OPTION_INDEX,
+    RELATION_TYPE_LABELS,
+    RELATION_TYPE_OPTIONS,
+)
 
 STATUS_LABELS = {
     "draft": "Concept",
@@ -24,14 +41,6 @@ STATUS_COLORS = {
     "archived": "#BCAAA4",
 }
 
-RELATION_TYPE_LABELS = {
-    "supports": "Ondersteunt",
-    "contradicts": "Spreekt tegen",
-    "supersedes": "Vervangt",
-    "related": "Gerelateerd",
-    "duplicate": "Duplicaat",
-}
-
 RELATION_COLORS = {
     "supports": "#66BB6A",
     "contradicts": "#EF5350",
@@ -44,38 +53,26 @@ STATUS_DISPLAY_ORDER = ["draft", "published", "archived"]
 STATUS_DISPLAY_OPTIONS = [
     STATUS_LABELS.get(status, status) for status in STATUS_DISPLAY_ORDER
 ]
+STATUS_OPTION_INDEX = {
+    label: idx for idx, label in enumerate(STATUS_DISPLAY_OPTIONS)
+}
 
-DEFAULT_RELATION_LABEL = "Geen relatie"
-
-RELATION_TYPE_ORDER = [
-    "supports",
-    "contradicts",
-    "supersedes",
-    "related",
-    "duplicate",
-]
-RELATION_TYPE_OPTIONS = [
-    DEFAULT_RELATION_LABEL,
-    *[RELATION_TYPE_LABELS.get(value, value) for value in RELATION_TYPE_ORDER],
-]
-RELATION_LABEL_TO_TYPE = {label: key for key, label in RELATION_TYPE_LABELS.items()}
-RELATION_LABEL_TO_TYPE[DEFAULT_RELATION_LABEL] = ""
+# Boven dit aantal notities toont de relatiegraaf eerst een samenvatting per status.
+GRAPH_AGGREGATE_THRESHOLD = 300
+GRAPH_GROUP_SUMMARY = "Samengevat per status"
+# Boven dit aantal nodes krijgt de graaf vaste posities zonder physics-simulatie,
+# rechte lijnen en maximaal GRAPH_MAX_EDGES_PER_SOURCE uitgaande relaties per node.
+GRAPH_STATIC_LAYOUT_THRESHOLD = 200
+GRAPH_LAYOUT_SPACING = 60.0
+GRAPH_MAX_EDGES_PER_SOURCE = 15
+# Aantal relaties dat per keer in de detailweergave wordt getoond.
+RELATION_PAGE_SIZE = 50
 
 DIRECTION_OPTIONS = {
     "outgoing": "Deze notitie → andere",
     "incoming": "Andere → deze notitie",
 }
 
-RELATION_HELP_TEXT = """
-<div style='line-height:1.2; font-size:0.9em; color:gray; margin-bottom:10px;'>
-<b>Ondersteunt</b> – bevestigt of versterkt andere notitie (bv. handleiding bevestigt procedure)<br>
-<b>Spreekt tegen</b> – inhoud is tegenstrijdig (bv. A zegt RAM IT, B zegt Zorgwaard)<br>
-<b>Vervangt</b> – nieuwe versie vervangt de oude (bv. Knox v3 vervangt Knox v2)<br>
-<b>Gerelateerd</b> – zelfde thema, geen bewijs (bv. Knox-account vs MFA-procedure)<br>
-<b>Duplicaat</b> – inhoud (bijna) hetzelfde
-</div>
-"""
-
 
 def format_status(value: str | None) -> str:
     key = value if value is not None else "-"
@@ -88,21 +85,20 @@ def format_datetime(value) -> str:
     return value.strftime("%d-%m-%Y %H:%M")
 
 
+# Als fragment draait een interactie in dit tabblad alleen dit tabblad opnieuw;
+# de andere tabbladen (en hun queries) blijven staan.
+@st.fragment
 def render() -> None:
     filter_col, limit_col = st.columns([3, 1])
     with filter_col:
-        query = (
-            st.text_input(
-                "Zoek (titel, samenvatting, auteur)",
-                placeholder="Bijv. onboarding of wijkteam",
-            )
-            .strip()
-            .lower()
-        )
+        query = st.text_input(
+            "Zoek (titel, samenvatting, auteur)",
+            placeholder="Bijv. onboarding of wijkteam",
+        ).strip()
     with limit_col:
         limit = int(
             st.number_input(
-                "Aantal te laden",
+                "Notities per pagina",
                 min_value=5,
                 max_value=500,
                 value=50,
@@ -110,10 +106,16 @@ def render() -> None:
             )
         )
 
-    notes = list_notes(limit=limit)
+    # Zoeken gebeurt in de database, zodat de limiet geldt voor de treffers.
+    notes, cursors, has_next = _load_page(query, limit)
+    _render_pager(notes, cursors, has_next)
 
     if not notes:
-        st.info("Nog geen notities gevonden.")
+        st.info(
+            "Geen notities gevonden voor deze zoekopdracht."
+            if query
+            else "Nog geen notities gevonden."
+        )
         return
 
     available_statuses = sorted(
@@ -129,39 +131,24 @@ def render() -> None:
         else []
     )
 
-    filtered_notes = []
-    for note in notes:
-        status_label = format_status(str(note.status))
-        if selected_statuses and status_label not in selected_statuses:
-            continue
-
-        searchable_fields = [
-            (note.title or "").lower(),
-            (note.summary or "").lower(),
-            (note.author or "").lower(),
+    # Eén pass met een set-lookup; zonder (of met alle) statussen geselecteerd
+    # is er niets te filteren.
+    selected_status_set = set(selected_statuses)
+    if selected_status_set and len(selected_status_set) < len(available_statuses):
+        filtered_notes = [
+            note
+            for note in notes
+            if format_status(str(note.status)) in selected_status_set
         ]
-        if query and not any(query in field for field in searchable_fields):
-            continue
-
-        filtered_notes.append(note)
+    else:
+        filtered_notes = notes
 
     notes_tab, graph_tab = st.tabs(["Notities", "Relaties"])
 
     with notes_tab:
         st.caption(f"{len(filtered_notes)} van {len(notes)} notities getoond")
 
-        data = [
-            {
-                "Selecteer": False,
-                "Titel": note.title,
-                "Auteur": note.author,
-                "Status": format_status(note.status),
-                "Aangemaakt": format_datetime(note.created_at),
-                "Bijgewerkt": format_datetime(note.updated_at),
-                "Samenvatting": note.summary,
-            }
-            for note in filtered_notes
-        ]
+        data = _build_table_rows(filtered_notes)
 
         data_view = st.data_editor(
             data,
@@ -196,8 +183,13 @@ def render() -> None:
             idx for idx, row in enumerate(data_view) if row.get("Selecteer")
         ]
 
+        selected_note = None
         if selected_indices:
-            selected_note = filtered_notes[selected_indices[0]]
+            # De lijst bevat geen inhoud; alleen de geselecteerde notitie wordt volledig geladen.
+            selected_item = filtered_notes[selected_indices[0]]
+            selected_note = get_note_snapshot(selected_item.id, selected_item.updated_at)
+
+        if selected_note is not None:
             _render_note_detail(selected_note, notes)
         else:
             st.caption("Selecteer een notitie om details te zien of te bewerken.")
@@ -207,6 +199,64 @@ def render() -> None:
         _render_relations_graph(filtered_notes)
 
 
+def _load_page(query: str, limit: int) -> tuple[list, list, bool]:
+    """
+    Laad de huidige pagina via keyset-paginering. `cursors` bevat per eerdere
+    pagina de (created_at, id) van de laatste notitie; een andere zoekopdracht
+    of paginagrootte begint weer bij pagina 1.
+    """
+    paging = st.session_state.setdefault("list-notes-paging", {})
+    if paging.get("key") != (query, limit):
+        paging["key"] = (query, limit)
+        paging["cursors"] = []
+
+    cursors = paging["cursors"]
+    after = cursors[-1] if cursors else None
+    # Eén rij extra ophalen om te weten of er een volgende pagina is.
+    page = list_notes(limit=limit + 1, after=after, search=query)
+    return page[:limit], cursors, len(page) > limit
+
+
+def _render_pager(notes: list, cursors: list, has_next: bool) -> None:
+    if not cursors and not has_next:
+        return
+
+    prev_col, page_col, next_col = st.columns([1, 3, 1])
+    if prev_col.button("← Vorige", disabled=not cursors, key="list-notes-prev"):
+        cursors.pop()
+        st.rerun(scope="fragment")
+    page_col.caption(f"Pagina {len(cursors) + 1}")
+    if next_col.button("Volgende →", disabled=not has_next, key="list-notes-next"):
+        last = notes[-1]
+        cursors.append((last.created_at, last.id))
+        st.rerun(scope="fragment")
+
+
+def _build_table_rows(notes: list) -> list[dict]:
+    fingerprint = tuple((str(note.id), note.updated_at) for note in notes)
+
+    cache = st.session_state.setdefault("list-notes-table-cache", {})
+    if cache.get("fingerprint") == fingerprint:
+        return cache["rows"]
+
+    rows = [
+        {
+            "Selecteer": False,
+            "Titel": note.title,
+            "Auteur": note.author,
+            "Status": format_status(note.status),
+            "Aangemaakt": format_datetime(note.created_at),
+            "Bijgewerkt": format_datetime(note.updated_at),
+            "Samenvatting": note.summary,
+        }
+        for note in notes
+    ]
+
+    cache["fingerprint"] = fingerprint
+    cache["rows"] = rows
+    return rows
+
+
 def _render_note_detail(note, all_notes: list) -> None:
     note_id = str(getattr(note, "id", ""))
 
@@ -236,16 +286,10 @@ def _render_note_detail(note, all_notes: list) -> None:
         )
 
         status_display = format_status(note.status)
-        status_options = STATUS_DISPLAY_OPTIONS or [status_display]
-        try:
-            status_index = status_options.index(status_display)
-        except ValueError:
-            status_index = 0
-
         st.selectbox(
             "Status",
-            status_options,
-            index=status_index,
+            STATUS_DISPLAY_OPTIONS,
+            index=STATUS_OPTION_INDEX.get(status_display, 0),
             key=f"detail-status-{note_id}",
             disabled=True,
         )
@@ -293,7 +337,7 @@ def _render_note_detail(note, all_notes: list) -> None:
                 else:
                     st.success("Notitie verwijderd.")
                     st.session_state.pop(confirm_key, None)
-                    st.rerun()
+                    st.rerun(scope="fragment")
 
     with relation_container:
         st.markdown("### Relaties")
@@ -308,21 +352,30 @@ def _render_note_detail(note, all_notes: list) -> None:
             if getattr(current, "id", None)
         }
 
+        partner_ids = set()
         for relation in relations:
+            partner_ids.add(str(getattr(relation, "source_note_id", "")))
+            partner_ids.add(str(getattr(relation, "target_note_id", "")))
+
+        # Partners buiten de huidige lijst in één query ophalen i.p.v. per relatie.
+        missing_ids = partner_ids - note_lookup.keys() - {"", note_id}
+        if missing_ids:
+            note_lookup.update(get_note_items(missing_ids))
+
+        shown_key = f"relations-shown-{note_id}"
+        shown = st.session_state.setdefault(shown_key, RELATION_PAGE_SIZE)
+        for relation in relations[:shown]:
             _render_relation_editor_entry(note_id, relation, note_lookup)
 
         if not relations:
             st.caption("Geen bestaande relaties voor deze notitie.")
+        elif len(relations) > shown:
+            st.caption(f"{shown} van {len(relations)} relaties getoond.")
+            if st.button("Toon meer", key=f"relations-more-{note_id}"):
+                st.session_state[shown_key] = shown + RELATION_PAGE_SIZE
+                st.rerun(scope="fragment")
 
-        existing_pairs = {
-            (
-                str(getattr(relation, "source_note_id", "")),
-                str(getattr(relation, "target_note_id", "")),
-            )
-            for relation in relations
-        }
-
-        _render_new_relation_section(note, relations, note_lookup, existing_pairs)
+        _render_new_relation_section(note, note_lookup, partner_ids)
 
 
 def _render_relation_editor_entry(
@@ -339,11 +392,6 @@ def _render_relation_editor_entry(
     )
 
     other_note = note_lookup.get(other_note_id)
-    if other_note is None and other_note_id:
-        fetched = get_note(other_note_id)
-        if fetched:
-            note_lookup[other_note_id] = fetched
-            other_note = fetched
 
     other_title = (
         getattr(other_note, "title", None) or f"Notitie {other_note_id}".strip()
@@ -358,19 +406,16 @@ def _render_relation_editor_entry(
     relation_label = RELATION_TYPE_LABELS.get(
         relation_key, relation_key or RELATION_TYPE_OPTIONS[0]
     )
-    try:
-        relation_index = RELATION_TYPE_OPTIONS.index(relation_label)
-    except ValueError:
-        relation_index = 0
+    relation_index = RELATION_OPTION_INDEX.get(relation_label, 0)
 
     direction_hint = "Deze notitie →" if is_outgoing else "→ Deze notitie"
     expander_title = f"{other_title} • {relation_label}"
 
     with st.expander(expander_title, expanded=False):
-        st.caption(other_summary)
-        st.caption(f"Richting: {direction_hint}")
+        caption_lines = [other_summary, f"Richting: {direction_hint}"]
         if other_status:
-            st.caption(f"Status: {other_status}")
+            caption_lines.append(f"Status: {other_status}")
+        st.caption("  \n".join(caption_lines))
 
         selected_label = st.selectbox(
             "Relatie",
@@ -395,7 +440,7 @@ def _render_relation_editor_entry(
                 except ValueError as exc:
                     st.error(f"Kon relatie niet bijwerken: {exc}")
                 else:
-                    st.rerun()
+                    st.rerun(scope="fragment")
 
         if delete_col.button("Verwijder", key=f"relation-delete-{relation_id}"):
             try:
@@ -404,14 +449,13 @@ def _render_relation_editor_entry(
             except ValueError as exc:
                 st.error(f"Kon relatie niet verwijderen: {exc}")
             else:
-                st.rerun()
+                st.rerun(scope="fragment")
 
 
 def _render_new_relation_section(
     note,
-    relations: list,
     note_lookup: dict,
-    existing_pairs: set,
+    partner_ids: set,
 ) -> None:
     note_id = str(getattr(note, "id", ""))
 
@@ -428,35 +472,16 @@ def _render_new_relation_section(
 
     suggestions = _load_relation_suggestions(note)
 
-    existing_partner_ids = {
-        str(getattr(relation, "target_note_id", ""))
-        for relation in relations
-        if str(getattr(relation, "target_note_id", ""))
-        and str(getattr(relation, "target_note_id", "")) != note_id
-    }
-    existing_partner_ids.update(
-        {
-            str(getattr(relation, "source_note_id", ""))
-            for relation in relations
-            if str(getattr(relation, "source_note_id", ""))
-            and str(getattr(relation, "source_note_id", "")) != note_id
-        }
-    )
+    # Notities die al gekoppeld zijn (in beide richtingen), de notitie zelf en
+    # reeds getoonde suggesties worden overgeslagen met één set-lookup.
+    excluded_ids = {"", note_id, *partner_ids}
 
     filtered_suggestions = []
-    seen_ids = set()
     for suggestion in suggestions:
         suggestion_id = str(getattr(suggestion, "note_id", ""))
-        if (
-            not suggestion_id
-            or suggestion_id == note_id
-            or suggestion_id in seen_ids
-            or suggestion_id in existing_partner_ids
-            or (note_id, suggestion_id) in existing_pairs
-            or (suggestion_id, note_id) in existing_pairs
-        ):
+        if suggestion_id in excluded_ids:
             continue
-        seen_ids.add(suggestion_id)
+        excluded_ids.add(suggestion_id)
         filtered_suggestions.append(suggestion)
 
     if not filtered_suggestions:
@@ -481,8 +506,10 @@ def _render_new_relation_section(
             f"{suggestion.title or '(geen titel)'} • {suggestion.score:.2f}",
             expanded=False,
         ):
-            st.caption(suggestion.summary or "Geen samenvatting beschikbaar.")
-            st.caption(f"Status: {format_status(suggestion.status)}")
+            st.caption(
+                f"{suggestion.summary or 'Geen samenvatting beschikbaar.'}  \n"
+                f"Status: {format_status(suggestion.status)}"
+            )
 
             st.selectbox(
                 "Relatie",
@@ -523,7 +550,7 @@ def _render_new_relation_section(
                 else:
                     _clear_new_relation_state_entry(note_id, suggestion_id)
                     st.success("Relatie toegevoegd.")
-                    st.rerun()
+                    st.rerun(scope="fragment")
 
 
 def _load_relation_suggestions(note) -> list:
@@ -549,12 +576,16 @@ def _load_relation_suggestions(note) -> list:
         return cache_entry.get("suggestions", [])
 
     try:
-        embedding = embed_text(content)
+        # De opgeslagen embedding hoort bij deze inhoud; alleen zonder embedding
+        # (bv. oudere notities) wordt er opnieuw een bij OpenAI opgevraagd.
+        embedding = get_note_embedding(note_id)
+        if embedding is None:
+            embedding = embed_text(content)
     except Exception as exc:  # pragma: no cover - toont fout in UI
         st.error(f"Kon relatiesuggesties niet genereren: {exc}")
         return []
 
-    if not embedding:
+    if embedding is None or len(embedding) == 0:
         return []
 
     suggestions = suggest_relations_for_embedding(embedding, limit=10)
@@ -610,9 +641,41 @@ def _render_relations_graph(notes: list) -> None:
         st.caption("Geen notitie-identificaties gevonden.")
         return
 
-    relations = list_relations_for_notes(note_ids)
+    # Alleen id's en type: titels en status staan al in de geladen notities.
+    relations = list_relation_edges(note_ids)
     note_lookup = {str(note.id): note for note in notes if getattr(note, "id", None)}
 
+    if len(note_lookup) > GRAPH_AGGREGATE_THRESHOLD:
+        # Te veel nodes voor een leesbare (en vlotte) vis.js-graaf: toon eerst
+        # een samenvatting per status en laat één status uitklappen.
+        present = {(note.status or "").strip() for note in note_lookup.values()}
+        group_options = [
+            GRAPH_GROUP_SUMMARY,
+            *[
+                format_status(status)
+                for status in STATUS_DISPLAY_ORDER
+                if status in present
+            ],
+        ]
+        expanded_group = st.selectbox(
+            "Weergave",
+            group_options,
+            key="relations-graph-expanded-group",
+            help=(
+                f"Meer dan {GRAPH_AGGREGATE_THRESHOLD} notities: "
+                "kies een status om uit te klappen."
+            ),
+        )
+        if expanded_group == GRAPH_GROUP_SUMMARY:
+            _render_aggregated_graph(note_lookup, relations)
+            return
+
+        note_lookup = {
+            note_id: note
+            for note_id, note in note_lookup.items()
+            if format_status((note.status or "").strip() or None) == expanded_group
+        }
+
     nodes = []
     for note_id, note in note_lookup.items():
         status_value = (note.status or "").strip()
@@ -633,7 +696,14 @@ def _render_relations_graph(notes: list) -> None:
             )
         )
 
+    # Grote grafen: vaste posities i.p.v. een force-simulatie in de browser,
+    # rechte lijnen en een maximum aantal uitgaande relaties per notitie.
+    large_graph = len(nodes) > GRAPH_STATIC_LAYOUT_THRESHOLD
+    edges_per_source: Counter = Counter()
+    hidden_edges = 0
+
     edges = []
+    edge_pairs = []
     for relation in relations:
         source_id = str(relation.source_note_id)
         target_id = str(relation.target_note_id)
@@ -641,7 +711,14 @@ def _render_relations_graph(notes: list) -> None:
         if source_id not in note_lookup or target_id not in note_lookup:
             continue
 
+        if large_graph:
+            if edges_per_source[source_id] >= GRAPH_MAX_EDGES_PER_SOURCE:
+                hidden_edges += 1
+                continue
+            edges_per_source[source_id] += 1
+
         relation_type = (relation.relation_type or "").strip()
+        edge_pairs.append((source_id, target_id))
         edges.append(
             Edge(
                 source=source_id,
@@ -652,7 +729,7 @@ def _render_relations_graph(notes: list) -> None:
                 color=RELATION_COLORS.get(relation_type, "#546E7A"),
                 font={"color": "#989898", "strokeWidth": 0, "size": 10},
                 width=2,
-                smooth=True,
+                smooth=not large_graph,
                 arrows={"to": {"enabled": True, "scaleFactor": 0.6}},
             )
         )
@@ -661,16 +738,117 @@ def _render_relations_graph(notes: list) -> None:
         st.caption("Geen relaties gevonden tussen de gefilterde notities.")
         return
 
+    if hidden_edges:
+        st.caption(
+            f"{hidden_edges} relaties verborgen: maximaal "
+            f"{GRAPH_MAX_EDGES_PER_SOURCE} uitgaande relaties per notitie getoond."
+        )
+
+    extra_options = {}
+    if large_graph:
+        positions = _compute_static_layout(tuple(note_lookup), tuple(edge_pairs))
+        for node in nodes:
+            node.x, node.y = positions[node.id]
+        # vis.js tekent dan tijdens slepen/zoomen alleen de nodes.
+        extra_options["interaction"] = {
+            "hideEdgesOnDrag": True,
+            "hideEdgesOnZoom": True,
+        }
+
     config = Config(
         height=700,
         width="100%",
         directed=True,
-        physics=True,
+        physics=not large_graph,
         hierarchical=False,
         nodeHighlightBehavior=True,
         staticGraph=False,
         backgroundColor="#FAFAFA",
         highlightColor="#FFC107",
+        **extra_options,
+    )
+
+    agraph(nodes=nodes, edges=edges, config=config)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _compute_static_layout(
+    node_ids: tuple[str, ...], edge_pairs: tuple[tuple[str, str], ...]
+) -> dict[str, tuple[float, float]]:
+    """
+    Zonnebloem-layout: nodes met de meeste relaties in het midden, de rest
+    gelijkmatig in een spiraal eromheen. Gecachet op de nodes en relaties.
+    """
+    degree: Counter = Counter()
+    for source_id, target_id in edge_pairs:
+        degree[source_id] += 1
+        degree[target_id] += 1
+
+    ordered = sorted(node_ids, key=lambda node_id: (-degree[node_id], node_id))
+    golden_angle = math.pi * (3 - math.sqrt(5))
+    positions = {}
+    for idx, node_id in enumerate(ordered):
+        radius = GRAPH_LAYOUT_SPACING * math.sqrt(idx)
+        angle = idx * golden_angle
+        positions[node_id] = (radius * math.cos(angle), radius * math.sin(angle))
+    return positions
+
+
+def _render_aggregated_graph(note_lookup: dict, relations: list) -> None:
+    """Eén meta-node per status; relaties opgeteld per (bron-, doelstatus, type)."""
+    status_by_id = {
+        note_id: (note.status or "").strip() for note_id, note in note_lookup.items()
+    }
+    status_counts = Counter(status_by_id.values())
+
+    nodes = [
+        Node(
+            id=f"status-{status or '-'}",
+            label=f"{format_status(status or None)} ({count})",
+            size=int(16 + 6 * math.sqrt(count)),
+            color=STATUS_COLORS.get(status, "#90A4AE"),
+            font={"color": "#CCCCCC", "size": 16},
+            borderWidth=1,
+        )
+        for status, count in status_counts.items()
+    ]
+
+    edge_counts: Counter = Counter()
+    for relation in relations:
+        source_status = status_by_id.get(str(relation.source_note_id))
+        target_status = status_by_id.get(str(relation.target_note_id))
+        if source_status is None or target_status is None:
+            continue
+        relation_type = (relation.relation_type or "").strip()
+        edge_counts[(source_status, target_status, relation_type)] += 1
+
+    if not edge_counts:
+        st.caption("Geen relaties gevonden tussen de gefilterde notities.")
+        return
+
+    edges = [
+        Edge(
+            source=f"status-{source_status or '-'}",
+            target=f"status-{target_status or '-'}",
+            label=(
+                f"{RELATION_TYPE_LABELS.get(relation_type, relation_type or 'Relatie')}"
+                f" ({count})"
+            ),
+            color=RELATION_COLORS.get(relation_type, "#546E7A"),
+            font={"color": "#989898", "strokeWidth": 0, "size": 10},
+            width=min(1 + math.log2(count), 8),
+            arrows={"to": {"enabled": True, "scaleFactor": 0.6}},
+        )
+        for (source_status, target_status, relation_type), count in edge_counts.items()
+    ]
+
+    config = Config(
+        height=500,
+        width="100%",
+        directed=True,
+        physics=True,
+        hierarchical=False,
+        backgroundColor="#FAFAFA",
     )
 
     agraph(nodes=nodes, edges=edges, config=config)
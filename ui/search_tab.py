@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import defaultdict
+
 import streamlit as st
 
 from infrastructure.llm.answering import answer_from_context
@@ -7,18 +9,59 @@ from services.entity_service import list_entities
 from services.note_service import search_question_matches
 
 
+@st.cache_data(ttl=300, show_spinner=False)
 def _load_entity_data() -> dict[str, list[str]]:
     entities = list_entities(limit=200)
 
-    grouped: dict[str, set[str]] = {}
+    grouped: defaultdict[str, set[str]] = defaultdict(set)
     for entity in entities:
         type_label = str(entity.entity_type or "Onbekend")
         value_label = str(entity.canonical_value or entity.value or "Onbekend")
-        grouped.setdefault(type_label, set()).add(value_label)
+        grouped[type_label].add(value_label)
+
+    # Types al gesorteerd in de cache, zodat render() de sleutels direct gebruikt.
+    return {type_label: sorted(grouped[type_label]) for type_label in sorted(grouped)}
+
+
+def clear_entity_cache() -> None:
+    """Vergeet de gecachte entiteiten, bv. nadat een notitie is opgeslagen."""
+    _load_entity_data.clear()
+
+
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def _cached_matches(
+    question: str, entity_type: str | None, entity_values: tuple[str, ...]
+) -> list[dict]:
+    # Korte TTL: dezelfde vraag opnieuw zoeken slaat de database over, terwijl
+    # nieuwe of gewijzigde notities binnen een minuut meedoen. Fouten
+    # (ValueError/RuntimeError) worden niet gecachet.
+    matches, _ = search_question_matches(
+        question,
+        limit=5,
+        entity_type=entity_type,
+        entity_values=list(entity_values),
+    )
+    return matches
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _cached_answer(question: str, matches: list[dict]) -> dict:
+    # Sleutel is de vraag plus de volledige bronnen: verandert een notitie,
+    # dan veranderen de matches en wordt het antwoord opnieuw gegenereerd.
+    return answer_from_context(question, matches)
+
 
-    return {type_label: sorted(values) for type_label, values in grouped.items()}
+def _get_answer(question: str, matches: list[dict]) -> dict:
+    out = _cached_answer(question, matches)
+    if not out.get("answer"):
+        # Mislukte LLM-call niet bewaren, anders blijft het lege antwoord hangen.
+        _cached_answer.clear(question, matches)
+    return out
 
 
+# Als fragment draait een interactie in dit tabblad alleen dit tabblad opnieuw;
+# de andere tabbladen (en hun queries) blijven staan.
+@st.fragment
 def render():
     entity_data = _load_entity_data()
 
@@ -34,7 +77,7 @@ def render():
         selected_type = None
         selected_values: list[str] = []
         if entity_data:
-            type_options = sorted(entity_data.keys())
+            type_options = list(entity_data)
             chosen_type = st.selectbox(
                 "Entiteitstype",
                 options=["Alle", *type_options],
@@ -66,11 +109,8 @@ def render():
             return
 
         try:
-            matches, _ = search_question_matches(
-                question_clean,
-                limit=5,
-                entity_type=selected_type,
-                entity_values=selected_values,
+            matches = _cached_matches(
+                question_clean, selected_type, tuple(selected_values)
             )
         except ValueError as exc:
             st.warning(str(exc))
@@ -83,7 +123,7 @@ def render():
             st.info("Geen notities gevonden die bij deze vraag passen.")
             return
 
-        out = answer_from_context(question_clean, matches)
+        out = _get_answer(question_clean, matches)
         answerContainer, sourcesContainer = st.columns([4, 2])
 
         with answerContainer: